@@ -1,33 +1,89 @@
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, Form, Query, HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.ticker import MaxNLocator
 import io
+import os
 import base64
-from math import exp, factorial
-from pydantic import BaseModel
-from typing import Optional
-from scipy.special import comb  # Función combinatoria más estable que math.comb
+import threading
+from functools import lru_cache
+from math import log, sqrt
+from pydantic import BaseModel, Field, ValidationError, model_validator
+from typing import Optional, Tuple
+from urllib.parse import urlencode
+from scipy.special import gammaln  # Log-gamma: evita enteros grandes y desbordamientos
+from stats_kernels import poisson_pmf, hypergeometric_pmf  # Núcleos escalares compilados con Numba
+from plot_renderers import render_bars_pillow, render_bars_svg  # Renderizadores ligeros (Pillow y SVG)
 
 # Crear la instancia de la aplicación FastAPI
 app = FastAPI(
     title="📊 Calculadora de Distribución de Poisson",
     description="API + Interfaz Web para calcular probabilidades de Poisson y visualizar gráficos.",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # Serialización JSON más rápida con orjson
 )
 
 # Configurar el directorio de plantillas HTML
 templates = Jinja2Templates(directory="templates")
 
+# Función para renderizar una sola vez las páginas sin resultados (formularios vacíos)
+@lru_cache(maxsize=None)
+def render_static_page(name: str) -> str:
+    """Renderiza la plantilla sin contexto y guarda el HTML resultante."""
+    return templates.get_template(name).render({"request": None})
+
 # Montar archivos estáticos (CSS, JS, imágenes, etc.)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Límites superiores de las entradas: λ acotado y enteros que caben en int64 (NumPy y Numba)
+MAX_LAM = 1e15
+MAX_INT = 10**18
+
+# Parámetros de la distribución de Poisson (compartidos por formulario, API y gráficos)
+class PoissonParams(BaseModel):
+    lam: float = Field(..., gt=0, le=MAX_LAM, allow_inf_nan=False)  # Parámetro lambda (tasa promedio de eventos), 0 < λ ≤ MAX_LAM
+
 # Modelo de entrada para la API de Poisson
-class PoissonRequest(BaseModel):
-    lam: float  # Parámetro lambda (tasa promedio de eventos)
-    x: int      # Número de eventos
+class PoissonRequest(PoissonParams):
+    x: int = Field(..., ge=0, le=MAX_INT)  # Número de eventos, 0 ≤ x ≤ MAX_INT
+
+# Función para validar parámetros de una ruta con los modelos compartidos
+def validate_params(model, **values):
+    """Construye el modelo y convierte sus errores en una respuesta 422, como FastAPI con el cuerpo JSON."""
+    try:
+        return model(**values)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False))
+
+# Mensajes en español para los errores de validación más habituales
+_VALIDATION_MESSAGES = {
+    "greater_than": "{field} debe ser mayor que {gt}",
+    "greater_than_equal": "{field} debe ser mayor o igual que {ge}",
+    "less_than_equal": "{field} debe ser menor o igual que {le}",
+    "finite_number": "{field} debe ser un número finito",
+    "int_parsing": "{field} debe ser un número entero",
+    "float_parsing": "{field} debe ser un número",
+}
+
+# Función para mostrar los errores de validación en las páginas HTML
+def validation_message(error: ValidationError) -> str:
+    """Une los mensajes de un ValidationError en una sola línea, en español."""
+    messages = []
+    for err in error.errors():
+        ctx = err.get("ctx", {})
+        if err["type"] == "value_error":  # Mensajes propios de los validadores (sin el prefijo "Value error, ")
+            messages.append(str(ctx.get("error", err["msg"])))
+        elif err["type"] in _VALIDATION_MESSAGES:
+            field = err["loc"][-1] if err["loc"] else "valor"
+            messages.append(_VALIDATION_MESSAGES[err["type"]].format(field=field, **ctx))
+        else:
+            messages.append(err["msg"])
+    return "; ".join(messages)
 
 # Modelo de salida para la API de Poisson
 class PoissonResponse(BaseModel):
@@ -35,56 +91,172 @@ class PoissonResponse(BaseModel):
     formula: str        # Fórmula utilizada
     lambda_value: float # Valor de lambda
     x_value: int        # Valor de x
-    plot_url: Optional[str] = None  # URL del gráfico en formato base64
+    plot_url: Optional[str] = None  # URL del gráfico SVG (/api/poisson/plot.svg)
+
+# Cabecera de caché para las rutas GET de la API (gráficos y cálculos): la respuesta depende
+# solo de los parámetros de la URL. Las rutas POST no la envían, porque navegadores y CDN no cachean POST.
+CACHE_HEADERS = {"Cache-Control": "public, max-age=86400"}
+
+# Motor de renderizado de los gráficos: "matplotlib" (por defecto) o "pillow" (más rápido)
+USE_PILLOW_RENDERER = os.environ.get("PLOT_RENDERER", "matplotlib").lower() == "pillow"
+
+# Figura y ejes reutilizables para todos los gráficos (evita crear una figura por petición).
+# Se usa la API orientada a objetos de Matplotlib en lugar del estado global de pyplot.
+# El diseño "constrained" ajusta los márgenes a las etiquetas sin el doble renderizado de bbox_inches='tight'.
+_FIG = Figure(figsize=(10, 5), layout="constrained")
+_CANVAS = FigureCanvasAgg(_FIG)
+_AX = _FIG.add_subplot(111)
+_LOCK = threading.Lock()  # Protege la figura compartida entre hilos
+
+# Función para dibujar un gráfico de barras en la figura compartida y devolverlo como PNG
+def _render_bar_plot(x_vals, y_vals, color: str, title: str, xlabel: str, step: int = 1) -> io.BytesIO:
+    """
+    Dibuja un gráfico de barras en la figura reutilizable y devuelve el buffer PNG.
+    step es la separación entre valores de x consecutivos (mayor que 1 si el eje está muestreado).
+    """
+    if USE_PILLOW_RENDERER:
+        return render_bars_pillow(x_vals, y_vals, title=title, color=color, xlabel=xlabel)
+
+    with _LOCK:
+        _AX.clear()
+        _AX.bar(x_vals, y_vals, width=0.8 * step, color=color, edgecolor='black')
+        _AX.set_title(title)
+        _AX.set_xlabel(xlabel)
+        _AX.set_ylabel('P(X = x)')
+        _AX.grid(axis='y', linestyle='--', alpha=0.7)
+        # Pocas marcas enteras en el eje x y sin desplazamiento (+1e9) para x grandes
+        _AX.xaxis.set_major_locator(MaxNLocator(integer=True))
+        _AX.ticklabel_format(axis='x', style='plain', useOffset=False)
+
+        # Guardar el gráfico en un buffer PNG
+        img = io.BytesIO()
+        _CANVAS.print_png(img)
+    return img
+
+# Número máximo de barras en un gráfico (evita gráficos gigantes con parámetros muy grandes)
+MAX_BARS = 60
+
+# Función para calcular el paso entre barras de un eje x
+def plot_step(min_x: int, max_x: int) -> int:
+    """Devuelve el paso mínimo para que x = min_x..max_x quepa en MAX_BARS barras."""
+    return max(1, -(-(max_x - min_x + 1) // MAX_BARS))
+
+# Función para calcular P(X = k) para k = min_x, min_x + step, ..., max_x de una sola vez
+def poisson_pmf_range(lam: float, min_x: int, max_x: int, step: int = 1) -> np.ndarray:
+    """
+    Calcula el vector de probabilidades de Poisson para x = min_x..max_x (con paso step).
+    Con paso 1 usa la recurrencia P(k) = P(k-1) * λ / k en escala logarítmica a partir
+    de P(min_x), de modo que e^(-λ) no se anula para λ grandes. Con un paso mayor evalúa
+    log P(x) = x·log λ - λ - log x! directamente en los puntos muestreados.
+    """
+    x = np.arange(min_x, max_x + 1, step)
+    if lam <= 0 or len(x) == 0:  # Mismo criterio de validez que poisson_pmf
+        return np.zeros(len(x))
+    if step > 1:
+        return np.exp(x * log(lam) - lam - gammaln(x + 1))
+    log_pmf = np.empty(len(x))
+    log_pmf[0] = min_x * log(lam) - lam - gammaln(min_x + 1)
+    log_pmf[1:] = log(lam) - np.log(x[1:])
+    np.cumsum(log_pmf, out=log_pmf)
+    return np.exp(log_pmf)
+
+# Función para calcular el rango del eje x a graficar según lambda
+@lru_cache(maxsize=512)
+def poisson_plot_range(lam: float) -> Tuple[int, int]:
+    """
+    Devuelve (min_x, max_x) para el gráfico de Poisson: 0..max(15, 3λ) si cabe en
+    MAX_BARS barras, o una ventana de ±4σ (σ = √λ) alrededor de la media si no.
+    """
+    max_x = max(15, int(lam*3))
+    if max_x + 1 <= MAX_BARS:
+        return 0, max_x
+    spread = 4 * sqrt(lam)
+    return max(0, int(lam - spread)), int(lam + spread) + 1
 
-# Función para calcular la probabilidad de Poisson (P(X = x))
-def poisson_pmf(x: int, lam: float) -> float:
-    """Calcula P(X = x) para distribución de Poisson."""
-    if x < 0 or lam <= 0:  # Validar que los valores sean válidos
-        return 0.0
-    return (exp(-lam) * (lam ** x)) / factorial(x)  # Fórmula de Poisson
+# Función para cuantizar lambda y mejorar la tasa de aciertos de la caché
+def _quantize_lam(lam: float) -> float:
+    """Redondea lambda a 6 cifras significativas (no decimales, para no anular λ pequeños)."""
+    return float(f"{lam:.6g}")
 
 # Función para generar un gráfico de Poisson en formato base64
-def generate_poisson_plot_base64(lam: float, max_x: int = 15) -> str:
+def generate_poisson_plot_base64(lam: float, max_x: int = 15, min_x: int = 0) -> str:
     """Genera gráfico de Poisson y lo devuelve como string base64."""
-    x_vals = np.arange(0, max_x + 1)  # Valores de x (0 a max_x)
-    y_vals = [poisson_pmf(x, lam) for x in x_vals]  # Calcular P(X = x) para cada x
-
-    # Crear el gráfico
-    plt.figure(figsize=(10, 5))
-    plt.bar(x_vals, y_vals, color='steelblue', edgecolor='black')
-    plt.title(f'Distribución de Poisson (λ = {lam})')
-    plt.xlabel('x (número de eventos)')
-    plt.ylabel('P(X = x)')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.xticks(x_vals)
-
-    # Guardar el gráfico en un buffer y convertirlo a base64
-    img = io.BytesIO()
-    plt.savefig(img, format='png', bbox_inches='tight')
-    img.seek(0)
-    plot_url = base64.b64encode(img.getvalue()).decode()
-    plt.close()
-    return plot_url
+    return _cached_poisson_plot_base64(_quantize_lam(lam), min_x, max_x)
+
+# Función para generar un gráfico de Poisson como bytes PNG
+def generate_poisson_plot_png(lam: float, max_x: int = 15, min_x: int = 0) -> bytes:
+    """Genera gráfico de Poisson y lo devuelve como imagen PNG."""
+    return _cached_poisson_plot_png(_quantize_lam(lam), min_x, max_x)
+
+@lru_cache(maxsize=512)
+def _cached_poisson_plot_base64(lam: float, min_x: int, max_x: int) -> str:
+    """Versión memoizada del gráfico de Poisson en base64 (la salida depende solo de los parámetros)."""
+    # getbuffer() expone el contenido del buffer sin copiarlo a un bytes intermedio
+    return base64.b64encode(_draw_poisson_plot(lam, min_x, max_x).getbuffer()).decode("ascii")
+
+@lru_cache(maxsize=512)
+def _cached_poisson_plot_png(lam: float, min_x: int, max_x: int) -> bytes:
+    """Versión memoizada del gráfico de Poisson en PNG."""
+    return _draw_poisson_plot(lam, min_x, max_x).getvalue()
+
+# Función para generar un gráfico de Poisson como texto SVG
+def generate_poisson_plot_svg(lam: float, max_x: int = 15, min_x: int = 0) -> str:
+    """Genera gráfico de Poisson como SVG, sin pasar por Matplotlib."""
+    return _cached_poisson_plot_svg(_quantize_lam(lam), min_x, max_x)
+
+@lru_cache(maxsize=512)
+def _cached_poisson_plot_svg(lam: float, min_x: int, max_x: int) -> str:
+    """Versión memoizada del gráfico de Poisson en SVG."""
+    x_vals, y_vals, color, title, xlabel, _ = _poisson_plot_data(lam, min_x, max_x)
+    return render_bars_svg(x_vals, y_vals, title=title, color=color, xlabel=xlabel)
+
+def _draw_poisson_plot(lam: float, min_x: int, max_x: int) -> io.BytesIO:
+    """Calcula las probabilidades de Poisson y dibuja el gráfico."""
+    return _render_bar_plot(*_poisson_plot_data(lam, min_x, max_x))
+
+def _poisson_plot_data(lam: float, min_x: int, max_x: int):
+    """Devuelve los datos y textos del gráfico de Poisson: (x_vals, y_vals, color, título, etiqueta x, paso)."""
+    step = plot_step(min_x, max_x)  # Muestrear el eje si hay más de MAX_BARS valores
+    x_vals = np.arange(min_x, max_x + 1, step)  # Valores de x (min_x a max_x)
+    y_vals = poisson_pmf_range(lam, min_x, max_x, step)  # Calcular P(X = x) para cada x
+    return (
+        x_vals, y_vals, 'steelblue',
+        f'Distribución de Poisson (λ = {lam})',
+        'x (número de eventos)',
+        step
+    )
+
+# Función compartida por el formulario y la API para calcular Poisson
+@lru_cache(maxsize=1024)
+def compute_poisson(lam: float, x: int) -> Tuple[float, str]:
+    """Devuelve la probabilidad P(X = x) y la fórmula utilizada."""
+    prob = poisson_pmf(x, lam)
+    formula = f"P(X = {x}) = e^(-{lam}) * {lam}^{x} / {x}!"
+    return prob, formula
 
 # Ruta principal: sirve la interfaz HTML
 @app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
+async def home():
     """Renderiza la página principal con el formulario."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(render_static_page("index.html"))
 
 # Ruta POST para calcular Poisson desde el formulario HTML
+# Las rutas que dibujan gráficos son síncronas: FastAPI las ejecuta en su pool de hilos
+# y el renderizado (bloqueante) no detiene el bucle de eventos.
 @app.post("/", response_class=HTMLResponse)
-async def calculate_from_form(
+def calculate_from_form(
     request: Request,
-    lam: float = Form(..., gt=0),  # Lambda debe ser mayor que 0
-    x: int = Form(..., ge=0)      # x debe ser mayor o igual a 0
+    lam: float = Form(...),  # Lambda (validado por PoissonRequest: mayor que 0)
+    x: int = Form(...)       # x (validado por PoissonRequest: mayor o igual a 0)
 ):
     try:
+        # Validar los valores con el mismo modelo que la API
+        PoissonRequest(lam=lam, x=x)
+
         # Calcular la probabilidad y generar el gráfico
-        prob = poisson_pmf(x, lam)
-        formula = f"P(X = {x}) = e^(-{lam}) * {lam}^{x} / {x}!"
-        plot_url = generate_poisson_plot_base64(lam, max_x=int(lam*3) if lam*3 > 15 else 15)
+        prob, formula = compute_poisson(lam, x)
+        min_x, max_x = poisson_plot_range(lam)
+        plot_url = generate_poisson_plot_base64(lam, max_x=max_x, min_x=min_x)
 
         # Renderizar la respuesta en la página HTML
         return templates.TemplateResponse("index.html", {
@@ -95,6 +267,14 @@ async def calculate_from_form(
             "lam": lam,
             "x": x
         })
+    except ValidationError as e:
+        # Mostrar los errores de validación en la página
+        return templates.TemplateResponse("index.html", {
+            "request": request,
+            "result": f"Error: {validation_message(e)}",
+            "lam": lam,
+            "x": x
+        })
     except Exception as e:
         # Manejar errores y mostrarlos en la página
         return templates.TemplateResponse("index.html", {
@@ -109,68 +289,194 @@ async def calculate_from_form(
 async def calculate_poisson_api(request: PoissonRequest):
     """
     Calcula la probabilidad P(X = x) para una distribución de Poisson.
-    Devuelve probabilidad, fórmula y gráfico en base64.
+    Devuelve probabilidad, fórmula y la URL del gráfico SVG.
     """
-    prob = poisson_pmf(request.x, request.lam)
-    formula = f"P(X = {request.x}) = e^(-{request.lam}) * {request.lam}^{request.x} / {request.x}!"
-    plot_url = generate_poisson_plot_base64(request.lam, max_x=int(request.lam*3) if request.lam*3 > 15 else 15)
+    return _poisson_api_response(request.lam, request.x)
+
+# Ruta API para calcular Poisson con parámetros en la URL (cacheable por navegadores y CDN)
+@app.get("/api/poisson", response_model=PoissonResponse)
+async def calculate_poisson_api_get(
+    response: Response,
+    lam: float = Query(...),  # Lambda (validado por PoissonRequest)
+    x: int = Query(...)       # Número de eventos
+):
+    """
+    Igual que POST /api/poisson, pero con los parámetros en la URL y cabecera Cache-Control.
+    """
+    params = validate_params(PoissonRequest, lam=lam, x=x)
+    response.headers.update(CACHE_HEADERS)
+    return _poisson_api_response(params.lam, params.x)
+
+# Respuesta de la API de Poisson (compute_poisson ya está memoizada)
+def _poisson_api_response(lam: float, x: int) -> PoissonResponse:
+    prob, formula = compute_poisson(lam, x)
+    min_x, max_x = poisson_plot_range(lam)
+    plot_url = app.url_path_for("poisson_plot_svg") + "?" + urlencode(
+        {"lam": lam, "min_x": min_x, "max_x": max_x}
+    )
 
     return PoissonResponse(
         probability=prob,
         formula=formula,
-        lambda_value=request.lam,
-        x_value=request.x,
+        lambda_value=lam,
+        x_value=x,
         plot_url=plot_url
     )
 
+# Función para completar y validar el rango del eje x recibido en la URL
+def _poisson_plot_query_range(lam: float, min_x: Optional[int], max_x: Optional[int]) -> Tuple[int, int]:
+    """Rellena min_x/max_x con los valores por defecto y comprueba que min_x ≤ max_x."""
+    default_min, default_max = poisson_plot_range(lam)
+    min_x = default_min if min_x is None else min_x
+    max_x = default_max if max_x is None else max_x
+    if min_x > max_x:
+        raise HTTPException(status_code=422, detail="min_x debe ser menor o igual que max_x.")
+    return min_x, max_x
+
+# Ruta API que devuelve el gráfico de Poisson como imagen PNG
+@app.get("/api/poisson/plot.png", name="poisson_plot_png")
+def poisson_plot_png(
+    lam: float = Query(...),  # Lambda (validado por PoissonParams: mayor que 0)
+    min_x: Optional[int] = Query(None, ge=0, le=MAX_INT),  # Por defecto se calcula a partir de lambda
+    max_x: Optional[int] = Query(None, ge=0, le=MAX_INT)   # Por defecto se calcula a partir de lambda
+):
+    """Devuelve el gráfico de Poisson como PNG, cacheable por el navegador."""
+    validate_params(PoissonParams, lam=lam)
+    min_x, max_x = _poisson_plot_query_range(lam, min_x, max_x)
+    png = generate_poisson_plot_png(lam, max_x=max_x, min_x=min_x)
+    return Response(content=png, media_type="image/png", headers=CACHE_HEADERS)
+
+# Ruta API que devuelve el gráfico de Poisson como SVG (sin rasterizar)
+@app.get("/api/poisson/plot.svg", name="poisson_plot_svg")
+def poisson_plot_svg(
+    lam: float = Query(...),  # Lambda (validado por PoissonParams: mayor que 0)
+    min_x: Optional[int] = Query(None, ge=0, le=MAX_INT),  # Por defecto se calcula a partir de lambda
+    max_x: Optional[int] = Query(None, ge=0, le=MAX_INT)   # Por defecto se calcula a partir de lambda
+):
+    """Devuelve el gráfico de Poisson como SVG, cacheable por el navegador."""
+    validate_params(PoissonParams, lam=lam)
+    min_x, max_x = _poisson_plot_query_range(lam, min_x, max_x)
+    svg = generate_poisson_plot_svg(lam, max_x=max_x, min_x=min_x)
+    return Response(content=svg, media_type="image/svg+xml", headers=CACHE_HEADERS)
+
 # === Funciones y rutas para la distribución hipergeométrica ===
 
-# Función para calcular la probabilidad de la distribución hipergeométrica
-def hypergeometric_pmf(x: int, N: int, K: int, n: int) -> float:
+# Función para calcular el logaritmo del coeficiente binomial C(n, k) sobre arrays
+def _log_comb_array(n, k):
+    """Calcula log C(n, k) con gammaln (acepta escalares o arrays de NumPy)."""
+    return gammaln(n + 1) - gammaln(k + 1) - gammaln(n - k + 1)
+
+# Función para calcular P(X = x) para x = min_x, min_x + step, ..., max_x de una sola vez
+def hypergeometric_pmf_range(N: int, K: int, n: int, min_x: int, max_x: int, step: int = 1) -> np.ndarray:
     """
-    Calcula P(X = x) para distribución hipergeométrica.
+    Calcula el vector de probabilidades hipergeométricas para x = min_x..max_x (con paso step),
+    dentro del soporte max(0, n+K-N)..min(n, K).
+    Con paso 1 solo el primer término usa gammaln; el resto sale de la recurrencia
+    P(x+1) = P(x) * (K-x)(n-x) / ((x+1)(N-K-n+x+1)), acumulada en escala logarítmica.
+    Con un paso mayor evalúa log P(x) con gammaln directamente en los puntos muestreados.
     """
-    if x < max(0, n + K - N) or x > min(n, K):  # Validar límites de x
-        return 0.0
-    numerator = comb(K, x) * comb(N - K, n - x)  # Numerador de la fórmula
-    denominator = comb(N, n)  # Denominador de la fórmula
-    if denominator == 0:  # Evitar división por cero
-        return 0.0
-    return float(numerator / denominator)
+    x_vals = np.arange(min_x, max_x + 1, step)
+    if K < 0 or n < 0 or K > N or n > N or len(x_vals) == 0:  # Mismo criterio de validez que hypergeometric_pmf
+        return np.zeros(len(x_vals))
+    if step > 1:
+        return np.exp(_log_comb_array(K, x_vals) + _log_comb_array(N - K, n - x_vals) - _log_comb_array(N, n))
+    x = x_vals[:-1].astype(np.float64)
+    log_pmf = np.empty(len(x_vals))
+    log_pmf[0] = _log_comb_array(K, min_x) + _log_comb_array(N - K, n - min_x) - _log_comb_array(N, n)
+    # En el soporte ningún factor se anula: x < min(n, K) y N-K-n+x+1 ≥ 1
+    log_pmf[1:] = np.log((K - x) * (n - x)) - np.log((x + 1) * (N - K - n + x + 1))
+    np.cumsum(log_pmf, out=log_pmf)
+    return np.exp(log_pmf)
 
-# Función para generar un gráfico de la distribución hipergeométrica
-def generate_hypergeometric_plot_base64(N: int, K: int, n: int) -> str:
+# Función para calcular el rango del eje x a graficar para la hipergeométrica
+@lru_cache(maxsize=512)
+def hypergeometric_plot_range(N: int, K: int, n: int) -> Tuple[int, int]:
     """
-    Genera gráfico de la distribución hipergeométrica.
+    Devuelve (min_x, max_x) para el gráfico hipergeométrico: todo el soporte si cabe en
+    MAX_BARS barras, o una ventana de ±4σ alrededor de la media si no.
     """
     min_x = max(0, n + K - N)  # Valor mínimo de x
     max_x = min(n, K)          # Valor máximo de x
-    x_vals = list(range(min_x, max_x + 1))  # Valores de x
-    y_vals = [hypergeometric_pmf(x, N, K, n) for x in x_vals]  # Calcular P(X = x)
-
-    # Crear el gráfico
-    plt.figure(figsize=(10, 5))
-    plt.bar(x_vals, y_vals, color='indianred', edgecolor='black')
-    plt.title(f'Distribución Hipergeométrica (N={N}, K={K}, n={n})')
-    plt.xlabel('x (número de éxitos en muestra)')
-    plt.ylabel('P(X = x)')
-    plt.grid(axis='y', linestyle='--', alpha=0.7)
-    plt.xticks(x_vals)
-
-    # Guardar el gráfico en un buffer y convertirlo a base64
-    img = io.BytesIO()
-    plt.savefig(img, format='png', bbox_inches='tight')
-    img.seek(0)
-    plot_url = base64.b64encode(img.getvalue()).decode()
-    plt.close()
-    return plot_url
+    if max_x - min_x + 1 <= MAX_BARS:
+        return min_x, max_x
+    p = K / N
+    spread = 4 * sqrt(n * p * (1 - p) * (N - n) / (N - 1))
+    mean = n * p
+    return max(min_x, int(mean - spread)), min(max_x, int(mean + spread) + 1)
+
+# Función compartida por el formulario y la API para calcular la hipergeométrica
+@lru_cache(maxsize=1024)
+def compute_hypergeometric(N: int, K: int, n: int, x: int) -> Tuple[float, str]:
+    """Devuelve la probabilidad P(X = x) y la fórmula utilizada."""
+    prob = hypergeometric_pmf(x, N, K, n)
+    formula = f"P(X = {x}) = C({K},{x}) * C({N - K},{n - x}) / C({N},{n})"
+    return prob, formula
+
+# Función para generar un gráfico de la distribución hipergeométrica en base64
+@lru_cache(maxsize=512)  # La salida depende solo de (N, K, n)
+def generate_hypergeometric_plot_base64(N: int, K: int, n: int) -> str:
+    """
+    Genera gráfico de la distribución hipergeométrica.
+    """
+    return base64.b64encode(_draw_hypergeometric_plot(N, K, n).getbuffer()).decode("ascii")
+
+# Función para generar un gráfico de la distribución hipergeométrica como bytes PNG
+@lru_cache(maxsize=512)
+def generate_hypergeometric_plot_png(N: int, K: int, n: int) -> bytes:
+    """
+    Genera gráfico de la distribución hipergeométrica como imagen PNG.
+    """
+    return _draw_hypergeometric_plot(N, K, n).getvalue()
+
+# Función para generar un gráfico de la distribución hipergeométrica como texto SVG
+@lru_cache(maxsize=512)
+def generate_hypergeometric_plot_svg(N: int, K: int, n: int) -> str:
+    """
+    Genera gráfico de la distribución hipergeométrica como SVG, sin pasar por Matplotlib.
+    """
+    x_vals, y_vals, color, title, xlabel, _ = _hypergeometric_plot_data(N, K, n)
+    return render_bars_svg(x_vals, y_vals, title=title, color=color, xlabel=xlabel)
+
+def _draw_hypergeometric_plot(N: int, K: int, n: int) -> io.BytesIO:
+    """Calcula las probabilidades hipergeométricas y dibuja el gráfico."""
+    return _render_bar_plot(*_hypergeometric_plot_data(N, K, n))
+
+def _hypergeometric_plot_data(N: int, K: int, n: int):
+    """Devuelve los datos y textos del gráfico hipergeométrico: (x_vals, y_vals, color, título, etiqueta x, paso)."""
+    min_x, max_x = hypergeometric_plot_range(N, K, n)
+    step = plot_step(min_x, max_x)  # Muestrear el eje si hay más de MAX_BARS valores
+    x_vals = np.arange(min_x, max_x + 1, step)  # Valores de x
+    y_vals = hypergeometric_pmf_range(N, K, n, min_x, max_x, step)  # Calcular P(X = x)
+    return (
+        x_vals, y_vals, 'indianred',
+        f'Distribución Hipergeométrica (N={N}, K={K}, n={n})',
+        'x (número de éxitos en muestra)',
+        step
+    )
+
+# Parámetros de la distribución hipergeométrica (compartidos por formulario, API y gráficos)
+class HypergeometricParams(BaseModel):
+    N: int = Field(..., gt=0, le=MAX_INT)  # Tamaño de la población, 0 < N ≤ MAX_INT
+    K: int = Field(..., ge=0, le=MAX_INT)  # Número de éxitos en la población, 0 ≤ K ≤ MAX_INT
+    n: int = Field(..., gt=0, le=MAX_INT)  # Tamaño de la muestra, 0 < n ≤ MAX_INT
+
+    @model_validator(mode="after")
+    def check_population(self):
+        """Comprueba que los éxitos y la muestra no superen la población."""
+        if self.K > self.N or self.n > self.N:
+            raise ValueError("Valores inconsistentes: revisa que K ≤ N y n ≤ N.")
+        return self
 
 # Modelos de entrada y salida para la API de hipergeométrica
-class HypergeometricRequest(BaseModel):
-    N: int  # Tamaño de la población
-    K: int  # Número de éxitos en la población
-    n: int  # Tamaño de la muestra
-    x: int  # Número de éxitos en la muestra
+class HypergeometricRequest(HypergeometricParams):
+    x: int = Field(..., ge=0, le=MAX_INT)  # Número de éxitos en la muestra, 0 ≤ x ≤ MAX_INT
+
+    @model_validator(mode="after")
+    def check_sample(self):
+        """Comprueba que x no supere la muestra ni los éxitos de la población."""
+        if self.x > self.n or self.x > self.K:
+            raise ValueError("Valores inconsistentes: revisa que x ≤ n y x ≤ K.")
+        return self
 
 class HypergeometricResponse(BaseModel):
     probability: float  # Probabilidad calculada
@@ -179,7 +485,7 @@ class HypergeometricResponse(BaseModel):
     K: int              # Número de éxitos en la población
     n: int              # Tamaño de la muestra
     x: int              # Número de éxitos en la muestra
-    plot_url: Optional[str] = None  # URL del gráfico en formato base64
+    plot_url: Optional[str] = None  # URL del gráfico SVG (/api/hypergeometric/plot.svg)
 
 # Ruta API para calcular hipergeométrica (JSON)
 @app.post("/api/hypergeometric", response_model=HypergeometricResponse)
@@ -187,43 +493,86 @@ async def calculate_hypergeometric_api(request: HypergeometricRequest):
     """
     Calcula P(X = x) para distribución hipergeométrica.
     """
-    prob = hypergeometric_pmf(request.x, request.N, request.K, request.n)
-    formula = f"P(X = {request.x}) = C({request.K},{request.x}) * C({request.N - request.K},{request.n - request.x}) / C({request.N},{request.n})"
-    plot_url = generate_hypergeometric_plot_base64(request.N, request.K, request.n)
+    return _hypergeometric_api_response(request.N, request.K, request.n, request.x)
+
+# Ruta API para calcular hipergeométrica con parámetros en la URL (cacheable por navegadores y CDN)
+@app.get("/api/hypergeometric", response_model=HypergeometricResponse)
+async def calculate_hypergeometric_api_get(
+    response: Response,
+    N: int = Query(...),  # Tamaño de la población (validado por HypergeometricRequest)
+    K: int = Query(...),  # Éxitos en la población
+    n: int = Query(...),  # Tamaño de la muestra
+    x: int = Query(...)   # Éxitos en la muestra
+):
+    """
+    Igual que POST /api/hypergeometric, pero con los parámetros en la URL y cabecera Cache-Control.
+    """
+    params = validate_params(HypergeometricRequest, N=N, K=K, n=n, x=x)
+    response.headers.update(CACHE_HEADERS)
+    return _hypergeometric_api_response(params.N, params.K, params.n, params.x)
+
+# Respuesta de la API hipergeométrica (compute_hypergeometric ya está memoizada)
+def _hypergeometric_api_response(N: int, K: int, n: int, x: int) -> HypergeometricResponse:
+    prob, formula = compute_hypergeometric(N, K, n, x)
+    plot_url = app.url_path_for("hypergeometric_plot_svg") + "?" + urlencode(
+        {"N": N, "K": K, "n": n}
+    )
 
     return HypergeometricResponse(
         probability=prob,
         formula=formula,
-        N=request.N,
-        K=request.K,
-        n=request.n,
-        x=request.x,
+        N=N,
+        K=K,
+        n=n,
+        x=x,
         plot_url=plot_url
     )
 
+# Ruta API que devuelve el gráfico hipergeométrico como imagen PNG
+@app.get("/api/hypergeometric/plot.png", name="hypergeometric_plot_png")
+def hypergeometric_plot_png(
+    N: int = Query(...),  # Tamaño de la población (validado por HypergeometricParams)
+    K: int = Query(...),  # Éxitos en la población
+    n: int = Query(...)   # Tamaño de la muestra
+):
+    """Devuelve el gráfico hipergeométrico como PNG, cacheable por el navegador."""
+    validate_params(HypergeometricParams, N=N, K=K, n=n)
+    png = generate_hypergeometric_plot_png(N, K, n)
+    return Response(content=png, media_type="image/png", headers=CACHE_HEADERS)
+
+# Ruta API que devuelve el gráfico hipergeométrico como SVG (sin rasterizar)
+@app.get("/api/hypergeometric/plot.svg", name="hypergeometric_plot_svg")
+def hypergeometric_plot_svg(
+    N: int = Query(...),  # Tamaño de la población (validado por HypergeometricParams)
+    K: int = Query(...),  # Éxitos en la población
+    n: int = Query(...)   # Tamaño de la muestra
+):
+    """Devuelve el gráfico hipergeométrico como SVG, cacheable por el navegador."""
+    validate_params(HypergeometricParams, N=N, K=K, n=n)
+    svg = generate_hypergeometric_plot_svg(N, K, n)
+    return Response(content=svg, media_type="image/svg+xml", headers=CACHE_HEADERS)
+
 # Ruta HTML para el formulario de hipergeométrica
 @app.get("/hyper", response_class=HTMLResponse)
-async def hyper_form(request: Request):
+async def hyper_form():
     """Renderiza la página del formulario para hipergeométrica."""
-    return templates.TemplateResponse("hyper.html", {"request": request})
+    return HTMLResponse(render_static_page("hyper.html"))
 
 # Ruta POST para calcular hipergeométrica desde el formulario HTML
 @app.post("/hyper", response_class=HTMLResponse)
-async def calculate_hyper_from_form(
+def calculate_hyper_from_form(
     request: Request,
-    N: int = Form(..., gt=0),  # N debe ser mayor que 0
-    K: int = Form(..., ge=0),  # K debe ser mayor o igual a 0
-    n: int = Form(..., gt=0),  # n debe ser mayor que 0
-    x: int = Form(..., ge=0)   # x debe ser mayor o igual a 0
+    N: int = Form(...),  # N (validado por HypergeometricRequest)
+    K: int = Form(...),  # K
+    n: int = Form(...),  # n
+    x: int = Form(...)   # x
 ):
     try:
-        # Validar que los valores sean consistentes
-        if K > N or n > N or x > n or x > K:
-            raise ValueError("Valores inconsistentes: revisa que K ≤ N, n ≤ N, x ≤ n y x ≤ K.")
+        # Validar que los valores sean consistentes (mismo modelo que la API)
+        HypergeometricRequest(N=N, K=K, n=n, x=x)
 
         # Calcular la probabilidad y generar el gráfico
-        prob = hypergeometric_pmf(x, N, K, n)
-        formula = f"P(X = {x}) = C({K},{x}) * C({N - K},{n - x}) / C({N},{n})"
+        prob, formula = compute_hypergeometric(N, K, n, x)
         plot_url = generate_hypergeometric_plot_base64(N, K, n)
 
         # Renderizar la respuesta en la página HTML
@@ -234,6 +583,13 @@ async def calculate_hyper_from_form(
             "plot_url": plot_url,
             "N": N, "K": K, "n": n, "x": x
         })
+    except ValidationError as e:
+        # Mostrar los errores de validación en la página
+        return templates.TemplateResponse("hyper.html", {
+            "request": request,
+            "result": f"Error: {validation_message(e)}",
+            "N": N, "K": K, "n": n, "x": x
+        })
     except Exception as e:
         # Manejar errores y mostrarlos en la página
         return templates.TemplateResponse("hyper.html", {
@@ -241,3 +597,16 @@ async def calculate_hyper_from_form(
             "result": f"Error: {str(e)}",
             "N": N, "K": K, "n": n, "x": x
         })
+
+# === Inicialización ===
+
+# Precalentar Matplotlib (fuentes, backend Agg), los núcleos de Numba y las páginas HTML al arrancar
+@app.on_event("startup")
+def warm_up():
+    """Genera gráficos de prueba para que la primera petición no pague el coste de inicialización."""
+    render_static_page("index.html")
+    render_static_page("hyper.html")
+    compute_poisson(1.0, 1)
+    compute_hypergeometric(10, 5, 3, 2)
+    generate_poisson_plot_base64(1.0, 5)
+    generate_hypergeometric_plot_base64(10, 5, 3)
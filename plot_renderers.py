@@ -0,0 +1,132 @@
+# Renderizadores ligeros de gráficos de barras (alternativas a Matplotlib)
+import html
+import io
+import math
+import os
+
+import matplotlib
+from PIL import Image, ImageDraw, ImageFont
+
+# Dimensiones y márgenes del lienzo (en píxeles)
+WIDTH, HEIGHT = 800, 400
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 70, 20, 40, 50
+PLOT_LEFT, PLOT_RIGHT = MARGIN_LEFT, WIDTH - MARGIN_RIGHT    # Límites horizontales del área de barras
+PLOT_TOP, PLOT_BOTTOM = MARGIN_TOP, HEIGHT - MARGIN_BOTTOM   # Límites verticales del área de barras
+Y_TICKS = 5  # Número de divisiones del eje y
+
+# Cargar las fuentes una sola vez (DejaVu Sans viene incluida con Matplotlib)
+_FONT_PATH = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "DejaVuSans.ttf")
+try:
+    _FONT = ImageFont.truetype(_FONT_PATH, 12)
+    _TITLE_FONT = ImageFont.truetype(_FONT_PATH, 16)
+except OSError:  # Fuente no disponible: usar la fuente por defecto de Pillow
+    _FONT = _TITLE_FONT = ImageFont.load_default()
+
+# Función para escribir un texto centrado en (cx, cy)
+def _draw_centered_text(draw: ImageDraw.ImageDraw, cx: float, cy: float, text: str, font) -> None:
+    """Escribe text centrado horizontal y verticalmente en el punto (cx, cy)."""
+    left, top, right, bottom = draw.textbbox((0, 0), text, font=font)
+    draw.text((cx - (right - left) / 2 - left, cy - (bottom - top) / 2 - top), text, fill="black", font=font)
+
+# Función para calcular la disposición común a todos los renderizadores
+def _bar_layout(x_vals, y_vals):
+    """
+    Calcula las coordenadas del gráfico de barras en el lienzo.
+    Devuelve (y_ticks, bars): y_ticks es una lista de (y, texto) para las divisiones del eje y,
+    y bars una lista de (x0, y0, x1, etiqueta) por barra, con etiqueta None si se omite.
+    """
+    plot_h = PLOT_BOTTOM - PLOT_TOP
+    y_max = max(y_vals, default=0.0)
+    if y_max <= 0:  # Evitar división por cero si todas las probabilidades son 0
+        y_max = 1.0
+
+    y_ticks = [
+        (PLOT_BOTTOM - plot_h * i / Y_TICKS, f"{y_max * i / Y_TICKS:.3f}")
+        for i in range(Y_TICKS + 1)
+    ]
+
+    # Barras y etiquetas del eje x (se omiten algunas si hay demasiadas)
+    bars = []
+    count = len(x_vals)
+    if count:
+        slot = (PLOT_RIGHT - PLOT_LEFT) / count
+        label_step = max(1, math.ceil(30 / slot))  # Al menos 30 px entre etiquetas
+        for i, (x, p) in enumerate(zip(x_vals, y_vals)):
+            x0 = PLOT_LEFT + slot * (i + 0.1)
+            x1 = PLOT_LEFT + slot * (i + 0.9)
+            y0 = PLOT_BOTTOM - plot_h * float(p) / y_max
+            bars.append((x0, y0, x1, str(x) if i % label_step == 0 else None))
+    return y_ticks, bars
+
+# Función para dibujar un gráfico de barras con Pillow y devolverlo como PNG
+def render_bars_pillow(x_vals, y_vals, title: str, color: str = "steelblue", xlabel: str = "") -> io.BytesIO:
+    """
+    Dibuja un gráfico de barras simple (barras, rejilla y etiquetas) con Pillow.
+    Devuelve el buffer con la imagen en formato PNG.
+    """
+    img = Image.new("RGB", (WIDTH, HEIGHT), "white")
+    draw = ImageDraw.Draw(img)
+    y_ticks, bars = _bar_layout(x_vals, y_vals)
+
+    # Rejilla horizontal y etiquetas del eje y
+    for i, (y, label) in enumerate(y_ticks):
+        if i > 0:
+            draw.line([(PLOT_LEFT, y), (PLOT_RIGHT, y)], fill=(200, 200, 200))
+        left, top, right, bottom = draw.textbbox((0, 0), label, font=_FONT)
+        draw.text((PLOT_LEFT - 6 - (right - left) - left, y - (bottom - top) / 2 - top), label, fill="black", font=_FONT)
+
+    # Barras y etiquetas del eje x
+    for x0, y0, x1, label in bars:
+        draw.rectangle([x0, y0, x1, PLOT_BOTTOM], fill=color, outline="black")
+        if label is not None:
+            _draw_centered_text(draw, (x0 + x1) / 2, PLOT_BOTTOM + 12, label, _FONT)
+
+    # Ejes, título y etiqueta del eje x
+    draw.line([(PLOT_LEFT, PLOT_TOP), (PLOT_LEFT, PLOT_BOTTOM), (PLOT_RIGHT, PLOT_BOTTOM)], fill="black")
+    _draw_centered_text(draw, WIDTH / 2, MARGIN_TOP / 2, title, _TITLE_FONT)
+    if xlabel:
+        _draw_centered_text(draw, (PLOT_LEFT + PLOT_RIGHT) / 2, HEIGHT - 14, xlabel, _FONT)
+
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf
+
+# Función para generar un gráfico de barras como texto SVG (sin rasterizar)
+def render_bars_svg(x_vals, y_vals, title: str, color: str = "steelblue", xlabel: str = "") -> str:
+    """
+    Genera un gráfico de barras como documento SVG con la misma disposición
+    que render_bars_pillow. El navegador lo dibuja de forma nativa.
+    """
+    y_ticks, bars = _bar_layout(x_vals, y_vals)
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {WIDTH} {HEIGHT}" '
+        f'font-family="DejaVu Sans, sans-serif" font-size="12">',
+        f'<rect width="{WIDTH}" height="{HEIGHT}" fill="white"/>',
+    ]
+
+    # Rejilla horizontal y etiquetas del eje y
+    for i, (y, label) in enumerate(y_ticks):
+        if i > 0:
+            parts.append(f'<line x1="{PLOT_LEFT}" y1="{y:.1f}" x2="{PLOT_RIGHT}" y2="{y:.1f}" '
+                         f'stroke="#c8c8c8" stroke-dasharray="4 3"/>')
+        parts.append(f'<text x="{PLOT_LEFT - 6}" y="{y:.1f}" text-anchor="end" '
+                     f'dominant-baseline="middle">{label}</text>')
+
+    # Barras y etiquetas del eje x
+    for x0, y0, x1, label in bars:
+        parts.append(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" '
+                     f'height="{PLOT_BOTTOM - y0:.1f}" fill="{html.escape(color)}" stroke="black"/>')
+        if label is not None:
+            parts.append(f'<text x="{(x0 + x1) / 2:.1f}" y="{PLOT_BOTTOM + 16}" '
+                         f'text-anchor="middle">{label}</text>')
+
+    # Ejes, título y etiqueta del eje x
+    parts.append(f'<polyline points="{PLOT_LEFT},{PLOT_TOP} {PLOT_LEFT},{PLOT_BOTTOM} {PLOT_RIGHT},{PLOT_BOTTOM}" '
+                 f'fill="none" stroke="black"/>')
+    parts.append(f'<text x="{WIDTH / 2}" y="{MARGIN_TOP / 2}" text-anchor="middle" '
+                 f'dominant-baseline="middle" font-size="16">{html.escape(title)}</text>')
+    if xlabel:
+        parts.append(f'<text x="{(PLOT_LEFT + PLOT_RIGHT) / 2}" y="{HEIGHT - 10}" '
+                     f'text-anchor="middle">{html.escape(xlabel)}</text>')
+    parts.append("</svg>")
+    return "".join(parts)
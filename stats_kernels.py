@@ -0,0 +1,52 @@
+# Núcleos numéricos de las distribuciones, compilados con Numba cuando está disponible
+from math import exp, log, lgamma, factorial
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Sin Numba: se usan las funciones de Python puro
+    def njit(*args, **kwargs):
+        """Sustituto de numba.njit que devuelve la función sin compilar."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Tabla precalculada de log(n!) para n = 0..170 (quedan dentro del rango de float)
+_LOG_FACTORIAL = np.array([log(factorial(i)) for i in range(171)])
+
+# Función para obtener log(n!) desde la tabla o, si n es grande, con lgamma
+@njit(cache=True, fastmath=True)
+def _log_factorial(n: int) -> float:
+    """Devuelve log(n!) con una consulta O(1) a la tabla para n ≤ 170."""
+    if n < _LOG_FACTORIAL.shape[0]:
+        return _LOG_FACTORIAL[n]
+    return lgamma(n + 1)
+
+# Función para calcular la probabilidad de Poisson (P(X = x))
+@njit(cache=True, fastmath=True)
+def poisson_pmf(x: int, lam: float) -> float:
+    """Calcula P(X = x) para distribución de Poisson."""
+    if x < 0 or lam <= 0:  # Validar que los valores sean válidos
+        return 0.0
+    # e^(-λ) * λ^x / x! evaluado en escala logarítmica
+    return exp(x * log(lam) - lam - _log_factorial(x))
+
+# Función para calcular el logaritmo del coeficiente binomial C(n, k)
+@njit(cache=True, fastmath=True)
+def _log_comb(n: int, k: int) -> float:
+    """Calcula log C(n, k) a partir de log-factoriales."""
+    return _log_factorial(n) - _log_factorial(k) - _log_factorial(n - k)
+
+# Función para calcular la probabilidad de la distribución hipergeométrica
+@njit(cache=True, fastmath=True)
+def hypergeometric_pmf(x: int, N: int, K: int, n: int) -> float:
+    """
+    Calcula P(X = x) para distribución hipergeométrica.
+    """
+    if K < 0 or n < 0 or K > N or n > N:  # Parámetros inválidos: C(N, n) = 0
+        return 0.0
+    if x < max(0, n + K - N) or x > min(n, K):  # Validar límites de x
+        return 0.0
+    # C(K, x) * C(N - K, n - x) / C(N, n) evaluado en escala logarítmica
+    return exp(_log_comb(K, x) + _log_comb(N - K, n - x) - _log_comb(N, n))